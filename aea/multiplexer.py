@@ -29,6 +29,7 @@ from typing import (
     Callable,
     Collection,
     Dict,
+    Iterable,
     List,
     Optional,
     Sequence,
@@ -733,6 +734,37 @@ class AsyncMultiplexer(Runnable, WithLogger):
         else:
             self.out_queue.put_nowait(envelope)
 
+    async def _put_many(self, envelopes: Sequence[Envelope]) -> None:
+        """
+        Schedule several envelopes for sending them.
+
+        :param envelopes: the envelopes to be sent.
+        """
+        self._put_many_nowait(envelopes)
+
+    def _put_many_nowait(self, envelopes: Sequence[Envelope]) -> None:
+        """
+        Put several envelopes in the output queue.
+
+        :param envelopes: the envelopes to be sent.
+        """
+        for envelope in envelopes:
+            self.out_queue.put_nowait(envelope)
+
+    def put_many(self, envelopes: Sequence[Envelope]) -> None:
+        """
+        Schedule several envelopes for sending them.
+
+        The envelopes are handed over to the event loop in a single call,
+        rather than one call per envelope.
+
+        :param envelopes: the envelopes to be sent.
+        """
+        if self._threaded:
+            self._loop.call_soon_threadsafe(self._put_many_nowait, envelopes)
+        else:
+            self._put_many_nowait(envelopes)
+
     def _setup(
         self,
         connections: Collection[Connection],
@@ -853,6 +885,17 @@ class Multiplexer(AsyncMultiplexer):
         """
         self._thread_runner.call(super()._put(envelope))  # .result(240)
 
+    def put_many(self, envelopes: Sequence[Envelope]) -> None:
+        """
+        Schedule several envelopes for sending them.
+
+        The envelopes are handed over to the event loop in a single call,
+        rather than one call per envelope.
+
+        :param envelopes: the envelopes to be sent.
+        """
+        self._thread_runner.call(super()._put_many(envelopes))
+
 
 class InBox:
     """A queue from where you can only consume envelopes."""
@@ -980,16 +1023,49 @@ class OutBox:
         :param message: the message
         :param context: the envelope context
         """
+        envelope = self._make_envelope(message, context)
+        self.put(envelope)
+
+    def put_messages(
+        self,
+        messages: Iterable[Message],
+        context: Optional[EnvelopeContext] = None,
+    ) -> None:
+        """
+        Put several messages in the outbox.
+
+        This constructs an envelope for each message and hands them over
+        to the multiplexer in a single batch.
+
+        :param messages: the messages
+        :param context: the envelope context
+        """
+        envelopes = [self._make_envelope(message, context) for message in messages]
+        if len(envelopes) == 0:
+            return
+        self._multiplexer.logger.debug(f"Put {len(envelopes)} envelopes in the queue.")
+        self._multiplexer.put_many(envelopes)
+
+    @staticmethod
+    def _make_envelope(
+        message: Message, context: Optional[EnvelopeContext] = None
+    ) -> Envelope:
+        """
+        Construct an envelope for a message.
+
+        :param message: the message
+        :param context: the envelope context
+        :return: the envelope
+        """
         if not isinstance(message, Message):
             raise ValueError("Provided message not of type Message.")
         if not message.has_to:
             raise ValueError("Provided message has message.to not set.")
         if not message.has_sender:
             raise ValueError("Provided message has message.sender not set.")
-        envelope = Envelope(
+        return Envelope(
             to=message.to,
             sender=message.sender,
             message=message,
             context=context,
         )
-        self.put(envelope)
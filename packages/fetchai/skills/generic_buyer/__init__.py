@@ -22,4 +22,4 @@
 from aea.configurations.base import PublicId
 
 
-PUBLIC_ID = PublicId.from_str("fetchai/generic_buyer:0.27.6")
+PUBLIC_ID = PublicId.from_str("fetchai/generic_buyer:0.27.7")
@@ -52,6 +52,13 @@ from packages.fetchai.skills.generic_buyer.strategy import GenericStrategy
 
 LEDGER_API_ADDRESS = str(LEDGER_CONNECTION_PUBLIC_ID)
 
+_ACCEPT = FipaMessage.Performative.ACCEPT
+_CFP = FipaMessage.Performative.CFP
+_DECLINE = FipaMessage.Performative.DECLINE
+_INFORM = FipaMessage.Performative.INFORM
+_MATCH_ACCEPT_W_INFORM = FipaMessage.Performative.MATCH_ACCEPT_W_INFORM
+_PROPOSE = FipaMessage.Performative.PROPOSE
+
 
 class GenericFipaHandler(Handler):
     """This class implements a FIPA handler."""
@@ -77,13 +84,13 @@ class GenericFipaHandler(Handler):
             return
 
         # handle message
-        if fipa_msg.performative == FipaMessage.Performative.PROPOSE:
+        if fipa_msg.performative == _PROPOSE:
             self._handle_propose(fipa_msg, fipa_dialogue)
-        elif fipa_msg.performative == FipaMessage.Performative.DECLINE:
+        elif fipa_msg.performative == _DECLINE:
             self._handle_decline(fipa_msg, fipa_dialogue, fipa_dialogues)
-        elif fipa_msg.performative == FipaMessage.Performative.MATCH_ACCEPT_W_INFORM:
+        elif fipa_msg.performative == _MATCH_ACCEPT_W_INFORM:
             self._handle_match_accept(fipa_msg, fipa_dialogue)
-        elif fipa_msg.performative == FipaMessage.Performative.INFORM:
+        elif fipa_msg.performative == _INFORM:
             self._handle_inform(fipa_msg, fipa_dialogue, fipa_dialogues)
         else:
             self._handle_invalid(fipa_msg, fipa_dialogue)
@@ -98,7 +105,7 @@ class GenericFipaHandler(Handler):
         :param fipa_msg: the message
         """
         self.context.logger.info(
-            "received invalid fipa message={}, unidentified dialogue.".format(fipa_msg)
+            "received invalid fipa message=%s, unidentified dialogue.", fipa_msg
         )
         default_dialogues = cast(DefaultDialogues, self.context.default_dialogues)
         default_msg, _ = default_dialogues.create(
@@ -119,35 +126,33 @@ class GenericFipaHandler(Handler):
         :param fipa_msg: the message
         :param fipa_dialogue: the dialogue object
         """
-        self.context.logger.info(
-            "received proposal={} from sender={}".format(
-                fipa_msg.proposal.values,
-                fipa_msg.sender[-5:],
-            )
-        )
+        logger = self.context.logger
+        outbox = self.context.outbox
         strategy = cast(GenericStrategy, self.context.strategy)
+        short_sender = fipa_msg.sender[-5:]
+        logger.info(
+            "received proposal=%s from sender=%s",
+            fipa_msg.proposal.values,
+            short_sender,
+        )
         acceptable = strategy.is_acceptable_proposal(fipa_msg.proposal)
-        affordable = strategy.is_affordable_proposal(fipa_msg.proposal)
-        if acceptable and affordable:
-            self.context.logger.info(
-                "accepting the proposal from sender={}".format(fipa_msg.sender[-5:])
-            )
+        # affordability is only checked for acceptable proposals
+        if acceptable and strategy.is_affordable_proposal(fipa_msg.proposal):
+            logger.info("accepting the proposal from sender=%s", short_sender)
             terms = strategy.terms_from_proposal(fipa_msg.proposal, fipa_msg.sender)
             fipa_dialogue.terms = terms
             accept_msg = fipa_dialogue.reply(
-                performative=FipaMessage.Performative.ACCEPT,
+                performative=_ACCEPT,
                 target_message=fipa_msg,
             )
-            self.context.outbox.put_message(message=accept_msg)
+            outbox.put_message(message=accept_msg)
         else:
-            self.context.logger.info(
-                "declining the proposal from sender={}".format(fipa_msg.sender[-5:])
-            )
+            logger.info("declining the proposal from sender=%s", short_sender)
             decline_msg = fipa_dialogue.reply(
-                performative=FipaMessage.Performative.DECLINE,
+                performative=_DECLINE,
                 target_message=fipa_msg,
             )
-            self.context.outbox.put_message(message=decline_msg)
+            outbox.put_message(message=decline_msg)
 
     def _handle_decline(
         self,
@@ -163,7 +168,7 @@ class GenericFipaHandler(Handler):
         :param fipa_dialogues: the fipa dialogues
         """
         self.context.logger.info(
-            "received DECLINE from sender={}".format(fipa_msg.sender[-5:])
+            "received DECLINE from sender=%s", fipa_msg.sender[-5:]
         )
         target_message = fipa_dialogue.get_message_by_id(fipa_msg.target)
 
@@ -172,11 +177,11 @@ class GenericFipaHandler(Handler):
 
         declined_performative = target_message.performative
 
-        if declined_performative == FipaMessage.Performative.CFP:
+        if declined_performative == _CFP:
             fipa_dialogues.dialogue_stats.add_dialogue_endstate(
                 FipaDialogue.EndState.DECLINED_CFP, fipa_dialogue.is_self_initiated
             )
-        if declined_performative == FipaMessage.Performative.ACCEPT:
+        if declined_performative == _ACCEPT:
             fipa_dialogues.dialogue_stats.add_dialogue_endstate(
                 FipaDialogue.EndState.DECLINED_ACCEPT, fipa_dialogue.is_self_initiated
             )
@@ -191,9 +196,9 @@ class GenericFipaHandler(Handler):
         :param fipa_dialogue: the dialogue object
         """
         self.context.logger.info(
-            "received MATCH_ACCEPT_W_INFORM from sender={} with info={}".format(
-                fipa_msg.sender[-5:], fipa_msg.info
-            )
+            "received MATCH_ACCEPT_W_INFORM from sender=%s with info=%s",
+            fipa_msg.sender[-5:],
+            fipa_msg.info,
         )
         strategy = cast(GenericStrategy, self.context.strategy)
         if strategy.is_ledger_tx:
@@ -209,13 +214,13 @@ class GenericFipaHandler(Handler):
             tx_behaviour.waiting.append(fipa_dialogue)
         else:
             inform_msg = fipa_dialogue.reply(
-                performative=FipaMessage.Performative.INFORM,
+                performative=_INFORM,
                 target_message=fipa_msg,
                 info={"Done": "Sending payment via bank transfer"},
             )
             self.context.outbox.put_message(message=inform_msg)
             self.context.logger.info(
-                "informing counterparty={} of payment.".format(fipa_msg.sender[-5:])
+                "informing counterparty=%s of payment.", fipa_msg.sender[-5:]
             )
 
     def _handle_inform(
@@ -231,13 +236,11 @@ class GenericFipaHandler(Handler):
         :param fipa_dialogue: the fipa dialogue
         :param fipa_dialogues: the fipa dialogues
         """
-        self.context.logger.info(
-            "received INFORM from sender={}".format(fipa_msg.sender[-5:])
-        )
+        self.context.logger.info("received INFORM from sender=%s", fipa_msg.sender[-5:])
         if len(fipa_msg.info.keys()) >= 1:
             data = fipa_msg.info
             data_string = pprint.pformat(data)[:1000]
-            self.context.logger.info(f"received the following data={data_string}")
+            self.context.logger.info("received the following data=%s", data_string)
             fipa_dialogues.dialogue_stats.add_dialogue_endstate(
                 FipaDialogue.EndState.SUCCESSFUL, fipa_dialogue.is_self_initiated
             )
@@ -245,7 +248,7 @@ class GenericFipaHandler(Handler):
             strategy.successful_trade_with_counterparty(fipa_msg.sender, data)
         else:
             self.context.logger.info(
-                "received no data from sender={}".format(fipa_msg.sender[-5:])
+                "received no data from sender=%s", fipa_msg.sender[-5:]
             )
 
     def _handle_invalid(
@@ -258,9 +261,9 @@ class GenericFipaHandler(Handler):
         :param fipa_dialogue: the fipa dialogue
         """
         self.context.logger.warning(
-            "cannot handle fipa message of performative={} in dialogue={}.".format(
-                fipa_msg.performative, fipa_dialogue
-            )
+            "cannot handle fipa message of performative=%s in dialogue=%s.",
+            fipa_msg.performative,
+            fipa_dialogue,
         )
 
 
@@ -309,9 +312,8 @@ class GenericOefSearchHandler(Handler):
         :param oef_search_msg: the message
         """
         self.context.logger.info(
-            "received invalid oef_search message={}, unidentified dialogue.".format(
-                oef_search_msg
-            )
+            "received invalid oef_search message=%s, unidentified dialogue.",
+            oef_search_msg,
         )
 
     def _handle_error(
@@ -324,9 +326,9 @@ class GenericOefSearchHandler(Handler):
         :param oef_search_dialogue: the dialogue
         """
         self.context.logger.info(
-            "received oef_search error message={} in dialogue={}.".format(
-                oef_search_msg, oef_search_dialogue
-            )
+            "received oef_search error message=%s in dialogue=%s.",
+            oef_search_msg,
+            oef_search_dialogue,
         )
 
     def _handle_search(
@@ -338,38 +340,34 @@ class GenericOefSearchHandler(Handler):
         :param oef_search_msg: the oef search message
         :param oef_search_dialogue: the dialogue
         """
+        logger = self.context.logger
         if len(oef_search_msg.agents) == 0:
-            self.context.logger.info(
-                f"found no agents in dialogue={oef_search_dialogue}, continue searching."
+            logger.info(
+                "found no agents in dialogue=%s, continue searching.",
+                oef_search_dialogue,
             )
             return
         strategy = cast(GenericStrategy, self.context.strategy)
+        fipa_dialogues = cast(FipaDialogues, self.context.fipa_dialogues)
+        agents = [agent[-5:] for agent in oef_search_msg.agents]
         if strategy.is_stop_searching_on_result:
-            self.context.logger.info(
-                "found agents={}, stopping search.".format(
-                    list(map(lambda x: x[-5:], oef_search_msg.agents)),
-                )
-            )
+            logger.info("found agents=%s, stopping search.", agents)
             strategy.is_searching = False  # stopping search
         else:
-            self.context.logger.info(
-                "found agents={}.".format(
-                    list(map(lambda x: x[-5:], oef_search_msg.agents)),
-                )
-            )
+            logger.info("found agents=%s.", agents)
         query = strategy.get_service_query()
-        fipa_dialogues = cast(FipaDialogues, self.context.fipa_dialogues)
         counterparties = strategy.get_acceptable_counterparties(oef_search_msg.agents)
+        cfp_msgs = []
         for counterparty in counterparties:
             cfp_msg, _ = fipa_dialogues.create(
                 counterparty=counterparty,
-                performative=FipaMessage.Performative.CFP,
+                performative=_CFP,
                 query=query,
             )
-            self.context.outbox.put_message(message=cfp_msg)
-            self.context.logger.info(
-                "sending CFP to agent={}".format(counterparty[-5:])
-            )
+            cfp_msgs.append(cfp_msg)
+        self.context.outbox.put_messages(cfp_msgs)
+        for counterparty in counterparties:
+            logger.info("sending CFP to agent=%s", counterparty[-5:])
 
     def _handle_invalid(
         self, oef_search_msg: OefSearchMessage, oef_search_dialogue: OefSearchDialogue
@@ -381,10 +379,9 @@ class GenericOefSearchHandler(Handler):
         :param oef_search_dialogue: the dialogue
         """
         self.context.logger.warning(
-            "cannot handle oef_search message of performative={} in dialogue={}.".format(
-                oef_search_msg.performative,
-                oef_search_dialogue,
-            )
+            "cannot handle oef_search message of performative=%s in dialogue=%s.",
+            oef_search_msg.performative,
+            oef_search_dialogue,
         )
 
 
@@ -431,9 +428,7 @@ class GenericSigningHandler(Handler):
         :param signing_msg: the message
         """
         self.context.logger.info(
-            "received invalid signing message={}, unidentified dialogue.".format(
-                signing_msg
-            )
+            "received invalid signing message=%s, unidentified dialogue.", signing_msg
         )
 
     def _handle_signed_transaction(
@@ -468,9 +463,9 @@ class GenericSigningHandler(Handler):
         :param signing_dialogue: the dialogue
         """
         self.context.logger.info(
-            "transaction signing was not successful. Error_code={} in dialogue={}".format(
-                signing_msg.error_code, signing_dialogue
-            )
+            "transaction signing was not successful. Error_code=%s in dialogue=%s",
+            signing_msg.error_code,
+            signing_dialogue,
         )
         signing_msg_ = cast(
             Optional[SigningMessage], signing_dialogue.last_outgoing_message
@@ -496,9 +491,9 @@ class GenericSigningHandler(Handler):
         :param signing_dialogue: the dialogue
         """
         self.context.logger.warning(
-            "cannot handle signing message of performative={} in dialogue={}.".format(
-                signing_msg.performative, signing_dialogue
-            )
+            "cannot handle signing message of performative=%s in dialogue=%s.",
+            signing_msg.performative,
+            signing_dialogue,
         )
 
 
@@ -561,9 +556,8 @@ class GenericLedgerApiHandler(Handler):
         :param ledger_api_msg: the message
         """
         self.context.logger.info(
-            "received invalid ledger_api message={}, unidentified dialogue.".format(
-                ledger_api_msg
-            )
+            "received invalid ledger_api message=%s, unidentified dialogue.",
+            ledger_api_msg,
         )
 
     def _handle_balance(self, ledger_api_msg: LedgerApiMessage) -> None:
@@ -575,16 +569,17 @@ class GenericLedgerApiHandler(Handler):
         strategy = cast(GenericStrategy, self.context.strategy)
         if ledger_api_msg.balance > 0:
             self.context.logger.info(
-                "starting balance on {} ledger={}.".format(
-                    strategy.ledger_id,
-                    ledger_api_msg.balance,
-                )
+                "starting balance on %s ledger=%s.",
+                strategy.ledger_id,
+                ledger_api_msg.balance,
             )
             strategy.balance = ledger_api_msg.balance
             strategy.is_searching = True
         else:
             self.context.logger.warning(
-                f"you have no starting balance on {strategy.ledger_id} ledger! Stopping skill {self.skill_id}."
+                "you have no starting balance on %s ledger! Stopping skill %s.",
+                strategy.ledger_id,
+                self.skill_id,
             )
             self.context.is_active = False
 
@@ -597,7 +592,7 @@ class GenericLedgerApiHandler(Handler):
         :param ledger_api_msg: the ledger api message
         :param ledger_api_dialogue: the ledger api dialogue
         """
-        self.context.logger.info("received raw transaction={}".format(ledger_api_msg))
+        self.context.logger.info("received raw transaction=%s", ledger_api_msg)
         signing_dialogues = cast(SigningDialogues, self.context.signing_dialogues)
         signing_msg, signing_dialogue = signing_dialogues.create(
             counterparty=self.context.decision_maker_address,
@@ -622,9 +617,8 @@ class GenericLedgerApiHandler(Handler):
         :param ledger_api_dialogue: the ledger api dialogue
         """
         self.context.logger.info(
-            "transaction was successfully submitted. Transaction digest={}".format(
-                ledger_api_msg.transaction_digest
-            )
+            "transaction was successfully submitted. Transaction digest=%s",
+            ledger_api_msg.transaction_digest,
         )
         ledger_api_msg_ = ledger_api_dialogue.reply(
             performative=LedgerApiMessage.Performative.GET_TRANSACTION_RECEIPT,
@@ -663,22 +657,20 @@ class GenericLedgerApiHandler(Handler):
             if fipa_msg is None:
                 raise ValueError("Could not retrieve last fipa message")
             inform_msg = fipa_dialogue.reply(
-                performative=FipaMessage.Performative.INFORM,
+                performative=_INFORM,
                 target_message=fipa_msg,
                 info={"transaction_digest": ledger_api_msg_.transaction_digest.body},
             )
             self.context.outbox.put_message(message=inform_msg)
             self.context.logger.info(
-                "transaction confirmed, informing counterparty={} of transaction digest.".format(
-                    fipa_dialogue.dialogue_label.dialogue_opponent_addr[-5:],
-                )
+                "transaction confirmed, informing counterparty=%s of transaction digest.",
+                fipa_dialogue.dialogue_label.dialogue_opponent_addr[-5:],
             )
         else:
             tx_behaviour.failed_processing(ledger_api_dialogue)
             self.context.logger.info(
-                "transaction_receipt={} not settled or not valid, aborting".format(
-                    ledger_api_msg.transaction_receipt
-                )
+                "transaction_receipt=%s not settled or not valid, aborting",
+                ledger_api_msg.transaction_receipt,
             )
 
     def _handle_error(
@@ -691,9 +683,9 @@ class GenericLedgerApiHandler(Handler):
         :param ledger_api_dialogue: the ledger api dialogue
         """
         self.context.logger.info(
-            "received ledger_api error message={} in dialogue={}.".format(
-                ledger_api_msg, ledger_api_dialogue
-            )
+            "received ledger_api error message=%s in dialogue=%s.",
+            ledger_api_msg,
+            ledger_api_dialogue,
         )
         ledger_api_msg_ = cast(
             Optional[LedgerApiMessage], ledger_api_dialogue.last_outgoing_message
@@ -718,8 +710,7 @@ class GenericLedgerApiHandler(Handler):
         :param ledger_api_dialogue: the ledger api dialogue
         """
         self.context.logger.warning(
-            "cannot handle ledger_api message of performative={} in dialogue={}.".format(
-                ledger_api_msg.performative,
-                ledger_api_dialogue,
-            )
+            "cannot handle ledger_api message of performative=%s in dialogue=%s.",
+            ledger_api_msg.performative,
+            ledger_api_dialogue,
         )
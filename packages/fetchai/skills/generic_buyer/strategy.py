@@ -19,7 +19,7 @@
 
 """This module contains the strategy class."""
 
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Tuple
 
 from aea.common import Address
 from aea.exceptions import enforce
@@ -184,28 +184,31 @@ class GenericStrategy(Model):
         :param proposal: a description
         :return: whether it is acceptable
         """
+        values = proposal.values
+        if not all(
+            key in values
+            for key in [
+                "ledger_id",
+                "currency_id",
+                "price",
+                "service_id",
+                "quantity",
+                "tx_nonce",
+            ]
+        ):
+            return False
+        price = values["price"]
+        quantity = values["quantity"]
+        tx_nonce = values["tx_nonce"]
         result = (
-            all(
-                key in proposal.values
-                for key in [
-                    "ledger_id",
-                    "currency_id",
-                    "price",
-                    "service_id",
-                    "quantity",
-                    "tx_nonce",
-                ]
-            )
-            and proposal.values["ledger_id"] == self.ledger_id
-            and proposal.values["price"] > 0
-            and proposal.values["quantity"] >= self._min_quantity
-            and proposal.values["quantity"] <= self._max_quantity
-            and proposal.values["price"]
-            <= proposal.values["quantity"] * self._max_unit_price
-            and proposal.values["currency_id"] == self._currency_id
-            and proposal.values["service_id"] == self._service_id
-            and isinstance(proposal.values["tx_nonce"], str)
-            and proposal.values["tx_nonce"] != ""
+            values["ledger_id"] == self.ledger_id
+            and price > 0
+            and self._min_quantity <= quantity <= self._max_quantity
+            and price <= quantity * self._max_unit_price
+            and values["currency_id"] == self._currency_id
+            and values["service_id"] == self._service_id
+            and isinstance(tx_nonce, str)
+            and tx_nonce != ""
         )
         return result
 
@@ -232,11 +235,7 @@ class GenericStrategy(Model):
         :param counterparties: a tuple of counterparties
         :return: list of counterparties
         """
-        valid_counterparties: List[str] = []
-        for idx, counterparty in enumerate(counterparties):
-            if idx < self.max_negotiations:
-                valid_counterparties.append(counterparty)
-        return tuple(valid_counterparties)
+        return tuple(counterparties[: self.max_negotiations])
 
     def terms_from_proposal(
         self, proposal: Description, counterparty_address: Address
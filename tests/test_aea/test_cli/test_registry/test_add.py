@@ -31,6 +31,9 @@ from aea.configurations.base import PublicId
 class FetchPackageTestCase(TestCase):
     """Test case for fetch_package method."""
 
+    DEST_PATH = os.path.join("dest", "path", "package_folder_name")
+    DEST_PARENT = os.path.join("dest", "path")
+
     def test_fetch_package_positive(
         self, extract_mock, download_file_mock, request_api_mock
     ):
@@ -38,11 +41,10 @@ class FetchPackageTestCase(TestCase):
         obj_type = "connection"
         public_id = PublicId.from_str("author/name:0.1.0")
         cwd = "cwd"
-        dest_path = os.path.join("dest", "path", "package_folder_name")
 
-        fetch_package(obj_type, public_id, cwd, dest_path)
+        fetch_package(obj_type, public_id, cwd, self.DEST_PATH)
         request_api_mock.assert_called_with(
             "GET", "/connections/author/name/0.1.0", params=None
         )
         download_file_mock.assert_called_once_with("url", "cwd")
-        extract_mock.assert_called_once_with("filepath", os.path.join("dest", "path"))
+        extract_mock.assert_called_once_with("filepath", self.DEST_PARENT)
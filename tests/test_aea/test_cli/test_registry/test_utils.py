@@ -63,21 +63,39 @@ def _raise_json_decode_error(*args):
     raise JSONDecodeError(None, "None", 1)  # args requied for JSONDecodeError raising
 
 
-@mock.patch("aea.cli.registry.utils.requests.request")
 class RequestAPITestCase(TestCase):
     """Test case for request_api method."""
 
-    def test_request_api_positive(self, request_mock):
+    @classmethod
+    def setUpClass(cls):
+        """Set up the test class."""
+        cls.request_patch = mock.patch("aea.cli.registry.utils.requests.request")
+        cls.request_mock = cls.request_patch.start()
+        cls.resp_mock = mock.Mock()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down the test class."""
+        cls.request_patch.stop()
+
+    def setUp(self):
+        """Set up the test."""
+        self.request_mock.reset_mock()
+        self.resp_mock.reset_mock(return_value=True, side_effect=True)
+        self.resp_mock.json.reset_mock(return_value=True, side_effect=True)
+        if "status_code" in vars(self.resp_mock):
+            del self.resp_mock.status_code
+        self.request_mock.return_value = self.resp_mock
+
+    def test_request_api_positive(self):
         """Test for request_api method positive result."""
         expected_result = {"correct": "json"}
 
-        resp_mock = mock.Mock()
-        resp_mock.json = lambda: expected_result
-        resp_mock.status_code = 200
-        request_mock.return_value = resp_mock
+        self.resp_mock.json.return_value = expected_result
+        self.resp_mock.status_code = 200
 
         result = request_api("GET", "/path")
-        request_mock.assert_called_once_with(
+        self.request_mock.assert_called_once_with(
             method="GET",
             params=None,
             data=None,
@@ -90,80 +108,65 @@ class RequestAPITestCase(TestCase):
         result = request_api("GET", "/path", return_code=True)
         self.assertEqual(result, (expected_result, 200))
 
-    def test_request_api_404(self, request_mock):
+    def test_request_api_404(self):
         """Test for request_api method 404 server response."""
-        resp_mock = mock.Mock()
-        resp_mock.status_code = 404
-        request_mock.return_value = resp_mock
+        self.resp_mock.status_code = 404
         with self.assertRaises(ClickException):
             request_api("GET", "/path")
 
-    def test_request_api_500(self, request_mock):
+    def test_request_api_500(self):
         """Test for request_api method 500 server response."""
-        resp_mock = mock.Mock()
-        resp_mock.status_code = 500
-        resp_mock.json.return_value = {"detail": "test"}
-        request_mock.return_value = resp_mock
+        self.resp_mock.status_code = 500
+        self.resp_mock.json.return_value = {"detail": "test"}
         with self.assertRaises(ClickException):
             request_api("GET", "/path")
 
-    def test_request_api_201(self, request_mock):
+    def test_request_api_201(self):
         """Test for request_api method 201 server response."""
         expected_result = {"correct": "json"}
 
-        resp_mock = mock.Mock()
-        resp_mock.json = lambda: expected_result
-        resp_mock.status_code = 201
-        request_mock.return_value = resp_mock
+        self.resp_mock.json.return_value = expected_result
+        self.resp_mock.status_code = 201
         result = request_api("GET", "/path")
         self.assertEqual(result, expected_result)
 
-    def test_request_api_403(self, request_mock):
+    def test_request_api_403(self):
         """Test for request_api method notauthorized server response."""
-        resp_mock = mock.Mock()
-        resp_mock.status_code = 403
-        request_mock.return_value = resp_mock
+        self.resp_mock.status_code = 403
         with self.assertRaises(ClickException):
             request_api("GET", "/path")
 
-    def test_request_api_400(self, request_mock):
+    def test_request_api_400(self):
         """Test for request_api method 400 code server response."""
-        resp_mock = mock.Mock()
-        resp_mock.status_code = 400
-        request_mock.return_value = resp_mock
+        self.resp_mock.status_code = 400
         with self.assertRaises(ClickException):
             request_api("GET", "/path")
 
-    def test_request_api_409(self, request_mock):
+    def test_request_api_409(self):
         """Test for request_api method conflict server response."""
-        resp_mock = mock.Mock()
-        resp_mock.status_code = 409
-        resp_mock.json = lambda: {"detail": "some"}
-        request_mock.return_value = resp_mock
+        self.resp_mock.status_code = 409
+        self.resp_mock.json.return_value = {"detail": "some"}
         with self.assertRaises(ClickException):
             request_api("GET", "/path")
 
-    def test_request_api_unexpected_response(self, request_mock):
+    def test_request_api_unexpected_response(self):
         """Test for request_api method unexpected server response."""
-        resp_mock = mock.Mock()
         status_code = 501
-        resp_mock.status_code = status_code  # not implemented status
-        resp_mock.json = _raise_json_decode_error
-        request_mock.return_value = resp_mock
+        self.resp_mock.status_code = status_code  # not implemented status
+        self.resp_mock.json.side_effect = _raise_json_decode_error
         with self.assertRaises(ClickException):
             request_api("GET", "/path")
 
         error_msg = "Error occured."
-        resp_mock.json = mock.Mock(return_value={"detail": error_msg})
+        self.resp_mock.json.side_effect = None
+        self.resp_mock.json.return_value = {"detail": error_msg}
         with self.assertRaises(ClickException) as execinfo:
             request_api("GET", "/path")
         expected_exception = f"Wrong server response. Status code: {status_code}: Error detail: {error_msg}"
         self.assertEqual(str(execinfo.exception), expected_exception)
 
     @mock.patch("aea.cli.registry.utils.get_or_create_cli_config", return_value={})
-    def test_request_api_no_auth_data(
-        self, get_or_create_cli_config_mock, request_mock
-    ):
+    def test_request_api_no_auth_data(self, get_or_create_cli_config_mock):
         """Test for request_api method no auth data."""
         with self.assertRaises(ClickException):
             request_api("GET", "/path", is_auth=True)
@@ -172,29 +175,23 @@ class RequestAPITestCase(TestCase):
         "aea.cli.registry.utils.get_or_create_cli_config",
         return_value={AUTH_TOKEN_KEY: "key"},
     )
-    def test_request_api_with_auth_positive(
-        self, get_or_create_cli_config_mock, request_mock
-    ):
+    def test_request_api_with_auth_positive(self, get_or_create_cli_config_mock):
         """Test for request_api method with auth positive result."""
         expected_result = {"correct": "json"}
 
-        resp_mock = mock.Mock()
-        resp_mock.json = lambda: expected_result
-        resp_mock.status_code = 200
-        request_mock.return_value = resp_mock
+        self.resp_mock.json.return_value = expected_result
+        self.resp_mock.status_code = 200
 
         result = request_api("GET", "/path", is_auth=True)
         self.assertEqual(result, expected_result)
 
     @mock.patch("builtins.open", mock.mock_open())
-    def test_request_api_with_files_positive(self, request_mock):
+    def test_request_api_with_files_positive(self):
         """Test for request_api method with file positive result."""
         expected_result = {"correct": "json"}
 
-        resp_mock = mock.Mock()
-        resp_mock.json = lambda: expected_result
-        resp_mock.status_code = 200
-        request_mock.return_value = resp_mock
+        self.resp_mock.json.return_value = expected_result
+        self.resp_mock.status_code = 200
 
         test_files = {
             "file": open("file.tar.gz", "rb"),
@@ -214,38 +211,56 @@ class RequestAPINoResponseTestCase(TestCase):
             request_api("GET", "/path")
 
 
-@mock.patch("aea.cli.registry.utils.requests.get")
 class DownloadFileTestCase(TestCase):
     """Test case for download_file method."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up the test class."""
+        cls.get_patch = mock.patch("aea.cli.registry.utils.requests.get")
+        cls.get_mock = cls.get_patch.start()
+        cls.resp_mock = mock.Mock()
+        cls.raw_mock = mock.Mock()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Tear down the test class."""
+        cls.get_patch.stop()
+
+    def setUp(self):
+        """Set up the test."""
+        self.get_mock.reset_mock()
+        self.resp_mock.reset_mock(return_value=True, side_effect=True)
+        self.raw_mock.reset_mock(return_value=True, side_effect=True)
+        self.raw_mock.read.reset_mock(return_value=True, side_effect=True)
+        for attr in ("status_code", "raw"):
+            if attr in vars(self.resp_mock):
+                delattr(self.resp_mock, attr)
+        self.get_mock.return_value = self.resp_mock
+
     @mock.patch("builtins.open", mock.mock_open())
-    def test_download_file_positive(self, get_mock):
+    def test_download_file_positive(self):
         """Test for download_file method positive result."""
         filename = "filename.tar.gz"
         url = "url/{}".format(filename)
         cwd = "cwd"
         filepath = os.path.join(cwd, filename)
 
-        resp_mock = mock.Mock()
-        raw_mock = mock.Mock()
-        raw_mock.read = lambda: "file content"
+        self.raw_mock.read.return_value = "file content"
 
-        resp_mock.raw = raw_mock
-        resp_mock.status_code = 200
-        get_mock.return_value = resp_mock
+        self.resp_mock.raw = self.raw_mock
+        self.resp_mock.status_code = 200
 
         result = download_file(url, cwd)
         expected_result = filepath
         self.assertEqual(result, expected_result)
-        get_mock.assert_called_once_with(
+        self.get_mock.assert_called_once_with(
             url, stream=True, timeout=FILE_DOWNLOAD_TIMEOUT
         )
 
-    def test_download_file_wrong_response(self, get_mock):
+    def test_download_file_wrong_response(self):
         """Test for download_file method wrong response from file server."""
-        resp_mock = mock.Mock()
-        resp_mock.status_code = 404
-        get_mock.return_value = resp_mock
+        self.resp_mock.status_code = 404
 
         with self.assertRaises(ClickException):
             download_file("url", "cwd")
@@ -218,6 +218,39 @@ def test_outbox_put_message():
     multiplexer.disconnect()
 
 
+def test_outbox_put_messages():
+    """Tests that the envelopes created from the messages are in the queue."""
+    agent_address = "Agent0"
+    receiver_address = "Agent1"
+    messages = []
+    for message_id in range(1, 3):
+        msg = DefaultMessage(
+            dialogue_reference=("", ""),
+            message_id=message_id,
+            target=0,
+            performative=DefaultMessage.Performative.BYTES,
+            content=b"hello",
+        )
+        msg.to = receiver_address
+        msg.sender = agent_address
+        messages.append(msg)
+    dummy_connection = _make_dummy_connection()
+    multiplexer = Multiplexer([dummy_connection])
+    outbox = OutBox(multiplexer)
+    inbox = InBox(multiplexer)
+    multiplexer.connect()
+    wait_for_condition(
+        lambda: multiplexer.is_connected, 15, "Multiplexer is not connected"
+    )
+    outbox.put_messages(messages)
+    for msg in messages:
+        envelope = inbox.get(block=True, timeout=15)
+        assert envelope.message == msg
+    outbox.put_messages([])
+    assert outbox.empty()
+    multiplexer.disconnect()
+
+
 def test_outbox_empty():
     """Test thet the outbox queue is empty."""
     dummy_connection = _make_dummy_connection()
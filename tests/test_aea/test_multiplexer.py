@@ -668,6 +668,12 @@ async def test_outbox_negative():
             outbox.put_message(msg)
         assert str(execinfo.value) == "Provided message has message.sender not set."
 
+        with pytest.raises(ValueError) as execinfo:
+            outbox.put_messages([msg])
+        assert str(execinfo.value) == "Provided message has message.sender not set."
+
+        assert outbox.empty()
+
     finally:
         await multiplexer.disconnect()
 
@@ -111,7 +111,7 @@ class TestGenericSkills(AEATestCaseManyFlaky):
         self.add_item("connection", "fetchai/soef:0.27.6")
         self.set_config("agent.default_connection", "fetchai/p2p_libp2p:0.27.5")
         self.add_item("connection", "fetchai/ledger:0.21.5")
-        self.add_item("skill", "fetchai/generic_buyer:0.27.6")
+        self.add_item("skill", "fetchai/generic_buyer:0.27.7")
         setting_path = (
             "vendor.fetchai.skills.generic_buyer.models.strategy.args.is_ledger_tx"
         )
@@ -303,14 +303,14 @@ class TestGenericSkillsFetchaiLedger(AEATestCaseManyFlaky):
         self.add_item("connection", "fetchai/soef:0.27.6")
         self.set_config("agent.default_connection", "fetchai/p2p_libp2p:0.27.5")
         self.add_item("connection", "fetchai/ledger:0.21.5")
-        self.add_item("skill", "fetchai/generic_buyer:0.27.6")
+        self.add_item("skill", "fetchai/generic_buyer:0.27.7")
         setting_path = "agent.default_routing"
         self.nested_set_config(setting_path, default_routing)
 
         self.run_install()
 
         diff = self.difference_to_fetched_agent(
-            "fetchai/generic_buyer:0.30.5", buyer_aea_name
+            "fetchai/generic_buyer:0.30.6", buyer_aea_name
         )
         assert (
             diff == []
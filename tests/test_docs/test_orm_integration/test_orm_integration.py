@@ -198,7 +198,7 @@ class TestOrmIntegrationDocs(AEATestCaseManyFlaky):
         self.add_item("connection", "fetchai/soef:0.27.6")
         self.set_config("agent.default_connection", "fetchai/p2p_libp2p:0.27.5")
         self.add_item("connection", "fetchai/ledger:0.21.5")
-        self.add_item("skill", "fetchai/thermometer_client:0.26.6")
+        self.add_item("skill", "fetchai/thermometer_client:0.26.7")
         setting_path = "agent.default_routing"
         self.nested_set_config(setting_path, default_routing)
         buyer_skill_config_replacement = yaml.safe_load(buyer_strategy_replacement)
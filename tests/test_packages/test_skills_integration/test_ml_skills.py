@@ -119,7 +119,7 @@ class TestMLSkills(AEATestCaseManyFlaky):
         self.add_item("connection", "fetchai/soef:0.27.6")
         self.set_config("agent.default_connection", "fetchai/p2p_libp2p:0.27.5")
         self.add_item("connection", "fetchai/ledger:0.21.5")
-        self.add_item("skill", "fetchai/ml_train:0.29.6")
+        self.add_item("skill", "fetchai/ml_train:0.29.7")
         setting_path = (
             "vendor.fetchai.skills.ml_train.models.strategy.args.is_ledger_tx"
         )
@@ -307,13 +307,13 @@ class TestMLSkillsFetchaiLedger(AEATestCaseManyFlaky):
         self.add_item("connection", "fetchai/soef:0.27.6")
         self.set_config("agent.default_connection", "fetchai/p2p_libp2p:0.27.5")
         self.add_item("connection", "fetchai/ledger:0.21.5")
-        self.add_item("skill", "fetchai/ml_train:0.29.6")
+        self.add_item("skill", "fetchai/ml_train:0.29.7")
         setting_path = "agent.default_routing"
         self.nested_set_config(setting_path, default_routing)
         self.run_install()
 
         diff = self.difference_to_fetched_agent(
-            "fetchai/ml_model_trainer:0.33.5", model_trainer_aea_name
+            "fetchai/ml_model_trainer:0.33.6", model_trainer_aea_name
         )
         assert (
             diff == []
@@ -118,7 +118,7 @@ class TestThermometerSkill(AEATestCaseManyFlaky):
         )
         self.set_config("agent.default_connection", "fetchai/p2p_libp2p:0.27.5")
         self.add_item("connection", "fetchai/ledger:0.21.5")
-        self.add_item("skill", "fetchai/thermometer_client:0.26.6")
+        self.add_item("skill", "fetchai/thermometer_client:0.26.7")
         setting_path = (
             "vendor.fetchai.skills.thermometer_client.models.strategy.args.is_ledger_tx"
         )
@@ -319,13 +319,13 @@ class TestThermometerSkillFetchaiLedger(AEATestCaseManyFlaky):
         )
         self.set_config("agent.default_connection", "fetchai/p2p_libp2p:0.27.5")
         self.add_item("connection", "fetchai/ledger:0.21.5")
-        self.add_item("skill", "fetchai/thermometer_client:0.26.6")
+        self.add_item("skill", "fetchai/thermometer_client:0.26.7")
         setting_path = "agent.default_routing"
         self.nested_set_config(setting_path, default_routing)
         self.run_install()
 
         diff = self.difference_to_fetched_agent(
-            "fetchai/thermometer_client:0.32.5", thermometer_client_aea_name
+            "fetchai/thermometer_client:0.32.6", thermometer_client_aea_name
         )
         assert (
             diff == []
@@ -119,7 +119,7 @@ class TestWeatherSkills(AEATestCaseManyFlaky):
         )
         self.set_config("agent.default_connection", "fetchai/p2p_libp2p:0.27.5")
         self.add_item("connection", "fetchai/ledger:0.21.5")
-        self.add_item("skill", "fetchai/weather_client:0.26.6")
+        self.add_item("skill", "fetchai/weather_client:0.26.7")
         self.set_config("agent.default_connection", "fetchai/p2p_libp2p:0.27.5")
         dotted_path = (
             "vendor.fetchai.skills.weather_client.models.strategy.args.is_ledger_tx"
@@ -318,13 +318,13 @@ class TestWeatherSkillsFetchaiLedger(AEATestCaseManyFlaky):
         )
         self.set_config("agent.default_connection", "fetchai/p2p_libp2p:0.27.5")
         self.add_item("connection", "fetchai/ledger:0.21.5")
-        self.add_item("skill", "fetchai/weather_client:0.26.6")
+        self.add_item("skill", "fetchai/weather_client:0.26.7")
         setting_path = "agent.default_routing"
         self.nested_set_config(setting_path, default_routing)
         self.run_install()
 
         diff = self.difference_to_fetched_agent(
-            "fetchai/weather_client:0.33.5", weather_client_aea_name
+            "fetchai/weather_client:0.33.6", weather_client_aea_name
         )
         assert (
             diff == []
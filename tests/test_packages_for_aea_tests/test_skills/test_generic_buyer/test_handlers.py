@@ -118,7 +118,8 @@ class TestGenericFipaHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received invalid fipa message={incoming_message}, unidentified dialogue.",
+            "received invalid fipa message=%s, unidentified dialogue.",
+            incoming_message,
         )
 
         self.assert_quantity_in_outbox(1)
@@ -177,11 +178,14 @@ class TestGenericFipaHandler(BaseSkillTestCase):
         incoming_message = cast(FipaMessage, incoming_message)
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received proposal={incoming_message.proposal.values} from sender={COUNTERPARTY_AGENT_ADDRESS[-5:]}",
+            "received proposal=%s from sender=%s",
+            incoming_message.proposal.values,
+            COUNTERPARTY_AGENT_ADDRESS[-5:],
         )
         mock_logger.assert_any_call(
             logging.INFO,
-            f"accepting the proposal from sender={COUNTERPARTY_AGENT_ADDRESS[-5:]}",
+            "accepting the proposal from sender=%s",
+            COUNTERPARTY_AGENT_ADDRESS[-5:],
         )
 
         self.assert_quantity_in_outbox(1)
@@ -228,21 +232,25 @@ class TestGenericFipaHandler(BaseSkillTestCase):
                 self.strategy,
                 "is_affordable_proposal",
                 return_value=False,
-            ):
+            ) as mock_affordable:
                 with patch.object(
                     self.fipa_handler.context.logger, "log"
                 ) as mock_logger:
                     self.fipa_handler.handle(incoming_message)
 
         # after
+        mock_affordable.assert_not_called()
         incoming_message = cast(FipaMessage, incoming_message)
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received proposal={incoming_message.proposal.values} from sender={COUNTERPARTY_AGENT_ADDRESS[-5:]}",
+            "received proposal=%s from sender=%s",
+            incoming_message.proposal.values,
+            COUNTERPARTY_AGENT_ADDRESS[-5:],
         )
         mock_logger.assert_any_call(
             logging.INFO,
-            f"declining the proposal from sender={COUNTERPARTY_AGENT_ADDRESS[-5:]}",
+            "declining the proposal from sender=%s",
+            COUNTERPARTY_AGENT_ADDRESS[-5:],
         )
 
         self.assert_quantity_in_outbox(1)
@@ -285,7 +293,8 @@ class TestGenericFipaHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received DECLINE from sender={COUNTERPARTY_AGENT_ADDRESS[-5:]}",
+            "received DECLINE from sender=%s",
+            COUNTERPARTY_AGENT_ADDRESS[-5:],
         )
 
         for (
@@ -326,7 +335,8 @@ class TestGenericFipaHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received DECLINE from sender={COUNTERPARTY_AGENT_ADDRESS[-5:]}",
+            "received DECLINE from sender=%s",
+            COUNTERPARTY_AGENT_ADDRESS[-5:],
         )
 
         for (
@@ -377,7 +387,9 @@ class TestGenericFipaHandler(BaseSkillTestCase):
         # after
         mock_logger_handler.assert_any_call(
             logging.INFO,
-            f"received MATCH_ACCEPT_W_INFORM from sender={COUNTERPARTY_AGENT_ADDRESS[-5:]} with info={incoming_message.info}",
+            "received MATCH_ACCEPT_W_INFORM from sender=%s with info=%s",
+            COUNTERPARTY_AGENT_ADDRESS[-5:],
+            incoming_message.info,
         )
 
         # operation
@@ -422,7 +434,9 @@ class TestGenericFipaHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received MATCH_ACCEPT_W_INFORM from sender={COUNTERPARTY_AGENT_ADDRESS[-5:]} with info={incoming_message.info}",
+            "received MATCH_ACCEPT_W_INFORM from sender=%s with info=%s",
+            COUNTERPARTY_AGENT_ADDRESS[-5:],
+            incoming_message.info,
         )
 
         self.assert_quantity_in_outbox(1)
@@ -439,7 +453,8 @@ class TestGenericFipaHandler(BaseSkillTestCase):
 
         mock_logger.assert_any_call(
             logging.INFO,
-            f"informing counterparty={COUNTERPARTY_AGENT_ADDRESS[-5:]} of payment.",
+            "informing counterparty=%s of payment.",
+            COUNTERPARTY_AGENT_ADDRESS[-5:],
         )
 
     def test_handle_inform_with_data(self):
@@ -468,10 +483,11 @@ class TestGenericFipaHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received INFORM from sender={COUNTERPARTY_AGENT_ADDRESS[-5:]}",
+            "received INFORM from sender=%s",
+            COUNTERPARTY_AGENT_ADDRESS[-5:],
         )
         mock_logger.assert_any_call(
-            logging.INFO, "received the following data={'data_name': 'data'}"
+            logging.INFO, "received the following data=%s", "{'data_name': 'data'}"
         )
 
         for (
@@ -507,12 +523,14 @@ class TestGenericFipaHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received INFORM from sender={COUNTERPARTY_AGENT_ADDRESS[-5:]}",
+            "received INFORM from sender=%s",
+            COUNTERPARTY_AGENT_ADDRESS[-5:],
         )
 
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received no data from sender={COUNTERPARTY_AGENT_ADDRESS[-5:]}",
+            "received no data from sender=%s",
+            COUNTERPARTY_AGENT_ADDRESS[-5:],
         )
 
     def test_handle_invalid(self):
@@ -534,7 +552,9 @@ class TestGenericFipaHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.WARNING,
-            f"cannot handle fipa message of performative={incoming_message.performative} in dialogue={fipa_dialogue}.",
+            "cannot handle fipa message of performative=%s in dialogue=%s.",
+            incoming_message.performative,
+            fipa_dialogue,
         )
 
     def test_teardown(self):
@@ -588,7 +608,8 @@ class TestGenericOefSearchHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received invalid oef_search message={incoming_message}, unidentified dialogue.",
+            "received invalid oef_search message=%s, unidentified dialogue.",
+            incoming_message,
         )
 
     def test_handle_error(self):
@@ -611,7 +632,9 @@ class TestGenericOefSearchHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received oef_search error message={incoming_message} in dialogue={oef_dialogue}.",
+            "received oef_search error message=%s in dialogue=%s.",
+            incoming_message,
+            oef_dialogue,
         )
 
     def test_handle_search_zero_agents(self):
@@ -635,7 +658,8 @@ class TestGenericOefSearchHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"found no agents in dialogue={oef_dialogue}, continue searching.",
+            "found no agents in dialogue=%s, continue searching.",
+            oef_dialogue,
         )
 
     def test_handle_search_i(self):
@@ -665,7 +689,7 @@ class TestGenericOefSearchHandler(BaseSkillTestCase):
 
         # after
         mock_logger.assert_any_call(
-            logging.INFO, f"found agents={list(agents)}, stopping search."
+            logging.INFO, "found agents=%s, stopping search.", list(agents)
         )
 
         assert self.strategy.is_searching is False
@@ -682,7 +706,7 @@ class TestGenericOefSearchHandler(BaseSkillTestCase):
                 query=self.strategy.get_service_query(),
             )
             assert has_attributes, error_str
-            mock_logger.assert_any_call(logging.INFO, f"sending CFP to agent={agent}")
+            mock_logger.assert_any_call(logging.INFO, "sending CFP to agent=%s", agent)
 
     def test_handle_search_ii(self):
         """Test the _handle_search method of the oef_search handler where is_stop_searching_on_result is False."""
@@ -710,7 +734,7 @@ class TestGenericOefSearchHandler(BaseSkillTestCase):
             self.oef_search_handler.handle(incoming_message)
 
         # after
-        mock_logger.assert_any_call(logging.INFO, f"found agents={list(agents)}.")
+        mock_logger.assert_any_call(logging.INFO, "found agents=%s.", list(agents))
 
         assert self.strategy.is_searching is True
 
@@ -726,7 +750,7 @@ class TestGenericOefSearchHandler(BaseSkillTestCase):
                 query=self.strategy.get_service_query(),
             )
             assert has_attributes, error_str
-            mock_logger.assert_any_call(logging.INFO, f"sending CFP to agent={agent}")
+            mock_logger.assert_any_call(logging.INFO, "sending CFP to agent=%s", agent)
 
     def test_handle_search_more_than_max_negotiation(self):
         """Test the _handle_search method of the oef_search handler where number of agents is more than max_negotiation."""
@@ -752,7 +776,7 @@ class TestGenericOefSearchHandler(BaseSkillTestCase):
 
         # after
         mock_logger.assert_any_call(
-            logging.INFO, f"found agents={list(agents)}, stopping search."
+            logging.INFO, "found agents=%s, stopping search.", list(agents)
         )
 
         assert not self.strategy.is_searching
@@ -770,7 +794,7 @@ class TestGenericOefSearchHandler(BaseSkillTestCase):
             )
             assert has_attributes, error_str
             mock_logger.assert_any_call(
-                logging.INFO, f"sending CFP to agent={agents[idx]}"
+                logging.INFO, "sending CFP to agent=%s", agents[idx]
             )
 
     def test_handle_invalid(self):
@@ -791,7 +815,9 @@ class TestGenericOefSearchHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.WARNING,
-            f"cannot handle oef_search message of performative={invalid_performative} in dialogue={self.oef_dialogues.get_dialogue(incoming_message)}.",
+            "cannot handle oef_search message of performative=%s in dialogue=%s.",
+            invalid_performative,
+            self.oef_dialogues.get_dialogue(incoming_message),
         )
 
     def test_teardown(self):
@@ -888,7 +914,8 @@ class TestGenericSigningHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received invalid signing message={incoming_message}, unidentified dialogue.",
+            "received invalid signing message=%s, unidentified dialogue.",
+            incoming_message,
         )
 
     def test_handle_signed_transaction_last_ledger_api_message_is_none(
@@ -1040,7 +1067,9 @@ class TestGenericSigningHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"transaction signing was not successful. Error_code={incoming_message.error_code} in dialogue={signing_dialogue}",
+            "transaction signing was not successful. Error_code=%s in dialogue=%s",
+            incoming_message.error_code,
+            signing_dialogue,
         )
 
         behaviour = cast(
@@ -1073,7 +1102,9 @@ class TestGenericSigningHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.WARNING,
-            f"cannot handle signing message of performative={invalid_performative} in dialogue={self.signing_dialogues.get_dialogue(incoming_message)}.",
+            "cannot handle signing message of performative=%s in dialogue=%s.",
+            invalid_performative,
+            self.signing_dialogues.get_dialogue(incoming_message),
         )
 
     def test_teardown(self):
@@ -1193,7 +1224,8 @@ class TestGenericLedgerApiHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received invalid ledger_api message={incoming_message}, unidentified dialogue.",
+            "received invalid ledger_api message=%s, unidentified dialogue.",
+            incoming_message,
         )
 
     def test_handle_balance_positive_balance(self):
@@ -1230,7 +1262,9 @@ class TestGenericLedgerApiHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"starting balance on {self.strategy.ledger_id} ledger={incoming_message.balance}.",
+            "starting balance on %s ledger=%s.",
+            self.strategy.ledger_id,
+            incoming_message.balance,
         )
         assert self.strategy.balance == balance
         assert self.strategy.is_searching
@@ -1269,7 +1303,9 @@ class TestGenericLedgerApiHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.WARNING,
-            f"you have no starting balance on {self.strategy.ledger_id} ledger! Stopping skill {self.strategy.context.skill_id}.",
+            "you have no starting balance on %s ledger! Stopping skill %s.",
+            self.strategy.ledger_id,
+            self.strategy.context.skill_id,
         )
         assert not self.skill.skill_context.is_active
 
@@ -1309,7 +1345,7 @@ class TestGenericLedgerApiHandler(BaseSkillTestCase):
 
         # after
         mock_logger.assert_any_call(
-            logging.INFO, f"received raw transaction={incoming_message}"
+            logging.INFO, "received raw transaction=%s", incoming_message
         )
 
         message_quantity = self.get_quantity_in_decision_maker_inbox()
@@ -1358,7 +1394,8 @@ class TestGenericLedgerApiHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"transaction was successfully submitted. Transaction digest={incoming_message.transaction_digest}",
+            "transaction was successfully submitted. Transaction digest=%s",
+            incoming_message.transaction_digest,
         )
 
         self.assert_quantity_in_outbox(1)
@@ -1418,7 +1455,8 @@ class TestGenericLedgerApiHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"transaction confirmed, informing counterparty={fipa_dialogue.dialogue_label.dialogue_opponent_addr[-5:]} of transaction digest.",
+            "transaction confirmed, informing counterparty=%s of transaction digest.",
+            fipa_dialogue.dialogue_label.dialogue_opponent_addr[-5:],
         )
 
         self.assert_quantity_in_outbox(1)
@@ -1524,7 +1562,8 @@ class TestGenericLedgerApiHandler(BaseSkillTestCase):
 
         mock_logger.assert_any_call(
             logging.INFO,
-            f"transaction_receipt={self.transaction_receipt} not settled or not valid, aborting",
+            "transaction_receipt=%s not settled or not valid, aborting",
+            self.transaction_receipt,
         )
 
     def test_handle_error(self):
@@ -1553,7 +1592,9 @@ class TestGenericLedgerApiHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.INFO,
-            f"received ledger_api error message={incoming_message} in dialogue={ledger_api_dialogue}.",
+            "received ledger_api error message=%s in dialogue=%s.",
+            incoming_message,
+            ledger_api_dialogue,
         )
 
     def test_handle_invalid(self):
@@ -1576,7 +1617,9 @@ class TestGenericLedgerApiHandler(BaseSkillTestCase):
         # after
         mock_logger.assert_any_call(
             logging.WARNING,
-            f"cannot handle ledger_api message of performative={invalid_performative} in dialogue={self.ledger_api_dialogues.get_dialogue(incoming_message)}.",
+            "cannot handle ledger_api message of performative=%s in dialogue=%s.",
+            invalid_performative,
+            self.ledger_api_dialogues.get_dialogue(incoming_message),
         )
 
     def test_teardown(self):